@@ -0,0 +1,213 @@
+"""
+Consistency checks for UserDatabase's parallel storage structures.
+
+entries, pos_index, srno_index, the secondary indexes and the render cache
+must all describe the same users after any mix of adds, updates and
+deletes (including the swap-pop in delete_user).
+"""
+import contextlib
+import io
+import random
+import unittest
+from unittest import mock
+
+from user_management_system import User, UserDatabase, get_user_input_batch, main
+
+
+class UserDatabaseInvariantTest(unittest.TestCase):
+    def assert_consistent(self, db: UserDatabase) -> None:
+        self.assertEqual(len(db.entries), len(db.srno_index))
+        self.assertEqual(len(db.entries), len(db.pos_index))
+
+        for pos, user in enumerate(db.entries):
+            self.assertIs(db.srno_index[user.srno], user)
+            self.assertEqual(db.pos_index[user.srno], pos)
+
+        # Every user sits in exactly one bucket per index, under its own key
+        for field, index in db.indexes.items():
+            indexed = []
+            for norm, bucket in index.items():
+                self.assertTrue(bucket, f"empty bucket left in {field} index")
+                for srno in bucket:
+                    user = db.srno_index[srno]
+                    self.assertEqual(db._index_key(field, getattr(user, field)), norm)
+                    indexed.append(srno)
+            self.assertCountEqual(indexed, db.srno_index)
+
+        # Cached renderings only exist for live users and are never stale
+        for srno, text in db._render_cache.items():
+            self.assertIn(srno, db.srno_index)
+            self.assertEqual(text, db._format_user(db.srno_index[srno]))
+
+    def test_mixed_operations_keep_structures_in_sync(self):
+        rng = random.Random(0)
+        names = ["Ann", "BOB", "cy", "Dee"]
+        db = UserDatabase()
+        last_srno = 0
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(2000):
+                op = rng.random()
+                if op < 0.45:
+                    db.add_user(rng.choice(names), str(rng.randint(1, 9)),
+                                rng.choice("MF"), rng.choice(["Dev", "QA"]))
+                    # Serial numbers are never reused, even after deletions
+                    self.assertGreater(db.entries[-1].srno, last_srno)
+                    last_srno = db.entries[-1].srno
+                elif op < 0.7:
+                    key = rng.choice(["srno", "name", "age", "gender"])
+                    value = rng.choice(names + ["3", "m", str(rng.randint(1, db._next_srno or 1))])
+                    db.delete_user(key, value)
+                elif op < 0.9:
+                    db.update_user("srno", str(rng.randint(1, db._next_srno or 1)), {
+                        "name": rng.choice(names),
+                        "age": rng.choice([str(rng.randint(1, 9)), "bad"]),
+                        "gender": rng.choice("mf"),
+                    })
+                else:
+                    db.display_all()
+                self.assert_consistent(db)
+
+    def test_delete_last_and_only_entry(self):
+        db = UserDatabase()
+        db.add_user("Ann", "30", "F", "Dev")
+        db.add_user("Bob", "40", "M", "QA")
+
+        self.assertTrue(db.delete_user("srno", "2"))
+        self.assert_consistent(db)
+        self.assertTrue(db.delete_user("name", "ann"))
+        self.assert_consistent(db)
+        self.assertEqual(db.entries, [])
+
+        db.add_user("Cy", "50", "M", "Ops")
+        self.assertEqual(db.entries[0].srno, 3)
+        self.assert_consistent(db)
+
+    def test_unchanged_update_keeps_search_order(self):
+        db = UserDatabase()
+        db.add_user("Bob", "30", "M", "Dev")
+        db.add_user("bob", "30", "M", "QA")
+
+        # The UI resends every field; identical values must not reorder buckets
+        self.assertTrue(db.update_user("srno", "1", {
+            "name": "Bob", "age": "30", "gender": "M", "occupation": "Dev",
+        }))
+        self.assertEqual(db.find_user("name", "bob").occupation, "Dev")
+        self.assertEqual(db.find_user("age", "30").occupation, "Dev")
+        self.assertEqual(db.find_user("gender", "m").occupation, "Dev")
+        self.assert_consistent(db)
+
+
+class FindAllByAgeTest(unittest.TestCase):
+    def setUp(self):
+        self.db = UserDatabase()
+        for name, age in [("Ann", "20"), ("Bob", "30"), ("Cy", "40"), ("Dee", "50")]:
+            self.db.add_user(name, age, "M", "Dev")
+
+    def names(self, users):
+        return sorted(user.name for user in users)
+
+    def test_bounds_are_inclusive(self):
+        self.assertEqual(self.names(self.db.find_all_by_age(30, 40)), ["Bob", "Cy"])
+
+    def test_empty_range(self):
+        self.assertEqual(self.db.find_all_by_age(31, 39), [])
+        self.assertEqual(self.db.find_all_by_age(40, 30), [])
+
+    def test_results_after_swap_pop_delete(self):
+        # Deleting Ann moves Dee into position 0
+        self.assertTrue(self.db.delete_user("name", "ann"))
+        self.assertEqual(self.names(self.db.find_all_by_age(0, 100)), ["Bob", "Cy", "Dee"])
+        self.assertEqual(self.names(self.db.find_all_by_age(45, 55)), ["Dee"])
+
+
+class AgeParsingTest(unittest.TestCase):
+    def test_decimal_fast_path(self):
+        self.assertEqual(UserDatabase._parse_age("42"), 42)
+        self.assertEqual(UserDatabase._parse_age("٤٢"), 42) # Arabic-Indic digits
+
+    def test_signed_and_whitespace_input(self):
+        self.assertEqual(UserDatabase._parse_age("  30 "), 30)
+        self.assertEqual(UserDatabase._parse_age("-3"), -3)
+        self.assertEqual(UserDatabase._parse_age("+7"), 7)
+        self.assertEqual(UserDatabase._parse_age(25), 25)
+
+    def test_large_ages_are_accepted(self):
+        self.assertEqual(UserDatabase._parse_age(str(10 ** 12)), 10 ** 12)
+
+    def test_invalid_input_is_rejected(self):
+        for age in ("", "abc", "3.5", "²", None):
+            self.assertIsNone(UserDatabase._parse_age(age), age)
+
+
+class AddUsersBulkTest(unittest.TestCase):
+    def row(self, **overrides):
+        row = {"name": "Ann", "age": "30", "gender": "F", "occupation": "Dev"}
+        row.update(overrides)
+        return row
+
+    def test_skips_invalid_rows_and_counts_added(self):
+        db = UserDatabase()
+        rows = iter([
+            self.row(),
+            self.row(age="abc"),
+            self.row(gender=None),
+            {"name": "Bob"},
+            self.row(name="Cy"),
+        ])
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            added = db.add_users_bulk(rows)
+
+        self.assertEqual(added, 2)
+        self.assertEqual([user.name for user in db.entries], ["Ann", "Cy"])
+        self.assertIn("3 entries skipped", out.getvalue())
+
+    def test_accepts_same_values_as_add_user(self):
+        db = UserDatabase()
+        self.assertEqual(db.add_users_bulk([self.row(name=5, occupation=7)]), 1)
+        db.add_user(5, "30", "F", 7)
+        self.assertEqual(len(db.entries), 2)
+        self.assertEqual(db.entries[0], User(1, 5, 30, "F", 7))
+        self.assertEqual(db.entries[1], User(2, 5, 30, "F", 7))
+
+    def test_single_skip_message(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(UserDatabase().add_users_bulk([self.row(age="x")]), 0)
+        self.assertIn("1 entry skipped", out.getvalue())
+
+
+class BulkInputTest(unittest.TestCase):
+    def read_batch(self, text):
+        rows = []
+        with mock.patch("sys.stdin", io.StringIO(text)), \
+                contextlib.redirect_stdout(io.StringIO()) as out:
+            row = get_user_input_batch()
+            while row is not None:
+                rows.append(row)
+                row = get_user_input_batch()
+        return rows, out.getvalue()
+
+    def test_blank_line_ends_batch_and_malformed_lines_are_skipped(self):
+        rows, out = self.read_batch("Ann, 30 ,F,Dev\nnot,enough\nBob,40,M,QA\n\nCy,50,M,Ops\n")
+        self.assertEqual(rows, [
+            {"name": "Ann", "age": "30", "gender": "F", "occupation": "Dev"},
+            {"name": "Bob", "age": "40", "gender": "M", "occupation": "QA"},
+        ])
+        self.assertIn("Line skipped", out)
+
+    def test_eof_ends_batch(self):
+        rows, _ = self.read_batch("Ann,30,F,Dev\n")
+        self.assertEqual([row["name"] for row in rows], ["Ann"])
+
+    def test_session_ends_cleanly_when_piped_input_runs_out(self):
+        with mock.patch("sys.stdin", io.StringIO("7\nA,1,M,x\n")), \
+                contextlib.redirect_stdout(io.StringIO()) as out:
+            main()
+        self.assertIn("1 entry successfully added", out.getvalue())
+        self.assertIn("Goodbye", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
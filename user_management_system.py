@@ -5,13 +5,21 @@ Key Optimization: Implements an O(1) hash map lookup (self.srno_index)
 for all unique serial number searches, drastically improving performance 
 for update and delete operations on large datasets.
 """
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from functools import partial
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, Iterable, Callable
+
+# Display separators, built once rather than on every display call
+_SEP30 = "-" * 30
+_SEP43 = "=" * 43
 
 # -----------------------------
 # Data Model
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class User:
     srno: int
     name: str
@@ -24,6 +32,18 @@ class User:
 # Database Layer (Optimized)
 # -----------------------------
 class UserDatabase:
+    # Field names and their display labels, read from the User dataclass once
+    # at import instead of per row
+    _FIELDS = tuple(f.name for f in fields(User))
+    _CAP = tuple(f.capitalize() for f in _FIELDS)
+    # Fetches all field values of a user as a tuple in one C-level call
+    _VALUES = attrgetter(*_FIELDS)
+    # Template for one rendered user, filled positionally with a single format() call
+    _ROW_FMT = _SEP30 + "\n" + "".join(f"{cap}: {{}}\n" for cap in _CAP) + _SEP30 + "\n"
+    # Low-cardinality text fields whose values are interned, so every user
+    # with the same gender/occupation shares a single string object
+    _INTERNED = ('gender', 'occupation')
+
     def __init__(self):
         # Primary storage: list for iteration/display (O(n) display)
         self.entries: List[User] = []
@@ -31,46 +51,141 @@ class UserDatabase:
         # Performance Optimization: Dictionary for O(1) lookup by srno
         self.srno_index: Dict[int, User] = {} 
 
+        # Position of each srno in self.entries, enabling O(1) swap-pop deletion
+        self.pos_index: Dict[int, int] = {}
+        self._next_srno = 0
+
+        # Secondary hash indexes: normalized field value -> srnos holding it.
+        # Buckets are dicts used as insertion-ordered sets: find_user returns
+        # the user that has held the value longest (the one added to that
+        # bucket first), not the first match by position in self.entries.
+        self.indexes: Dict[str, Dict[Any, Dict[int, None]]] = {
+            key: defaultdict(dict) for key in ('name', 'age', 'gender', 'occupation')
+        }
+
+        # Rendered display text per srno, reused until the user changes
+        self._render_cache: Dict[int, str] = {}
+
+        # Search dispatch table: one specialized finder per searchable field
+        self._finders = {
+            'srno': self._find_by_srno,
+            'age': self._find_by_age,
+            'name': partial(self._find_by_text, self.indexes['name']),
+            'gender': partial(self._find_by_text, self.indexes['gender']),
+            'occupation': partial(self._find_by_text, self.indexes['occupation']),
+        }
+
     def _get_next_srno(self) -> int:
-        return len(self.entries) + 1
+        # Monotonic counter: srnos are never reused, even after deletions
+        self._next_srno += 1
+        return self._next_srno
 
-    def add_user(self, name: str, age: Any, gender: str, occupation: str) -> None:
+    @staticmethod
+    def _index_key(key: str, value: Any) -> Any:
+        """Normalizes a field value for use as a secondary index key."""
+        if key == 'age':
+            return int(value)
+        return str(value).lower()
+
+    def _index_field(self, key: str, value: Any, srno: int) -> None:
+        self.indexes[key][self._index_key(key, value)][srno] = None
+
+    def _unindex_field(self, key: str, value: Any, srno: int) -> None:
+        index = self.indexes[key]
+        norm = self._index_key(key, value)
+        bucket = index[norm]
+        del bucket[srno]
+        if not bucket:
+            del index[norm] # Drop empty buckets so the index doesn't grow unbounded
+
+    @staticmethod
+    def _parse_age(age: Any) -> Optional[int]:
+        """Converts age to an int, returning None if it is not a valid number."""
+        if isinstance(age, str):
+            age = age.strip()
+        # Fast path: plain digit strings skip the try/except setup entirely
+        if isinstance(age, str) and age.isdecimal():
+            return int(age)
         try:
-            # Robustness: Ensure age is an integer
-            age_int = int(age)
-        except ValueError:
+            # Robustness: Handles signs, surrounding text and non-str inputs
+            return int(age)
+        except (TypeError, ValueError):
+            return None
+
+    def add_user(self, name: str, age: Any, gender: str, occupation: str) -> None:
+        # Robustness: Ensure age is an integer
+        age_int = self._parse_age(age)
+        if age_int is None:
             print("Error: Age must be a valid number. Entry aborted.")
             return
+        self._insert_user(name, age_int, gender, occupation)
+
+    def add_users_bulk(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Adds many users at once, returning how many were added."""
+        added = skipped = 0
+        for row in rows:
+            # Robustness: Invalid rows are skipped so the valid ones still load.
+            # Other values are accepted as add_user accepts them; only missing
+            # fields are rejected.
+            name, gender, occupation = row.get("name"), row.get("gender"), row.get("occupation")
+            age_int = self._parse_age(row.get("age"))
+            if age_int is None or name is None or gender is None or occupation is None:
+                skipped += 1
+                continue
+            self._insert_user(name, age_int, gender, occupation)
+            added += 1
+        if skipped:
+            print(f"Error: {skipped} {'entry' if skipped == 1 else 'entries'} skipped. Age must be a valid number "
+                  "and name, gender and occupation must be provided.")
+        return added
 
-        user = User(
-            srno=self._get_next_srno(), 
-            name=name, 
-            age=age_int, 
-            gender=gender, 
-            occupation=occupation
-        )
+    def _insert_user(self, name: str, age_int: int, gender: str, occupation: str) -> None:
+        if isinstance(gender, str):
+            gender = sys.intern(gender)
+        if isinstance(occupation, str):
+            occupation = sys.intern(occupation)
+        # Positional construction in field order (srno, name, age, gender,
+        # occupation) skips keyword matching in the generated __init__
+        user = User(self._get_next_srno(), name, age_int, gender, occupation)
         
         # Add to both data structures
         self.entries.append(user)
         self.srno_index[user.srno] = user
+        self.pos_index[user.srno] = len(self.entries) - 1
+        for key in self.indexes:
+            self._index_field(key, getattr(user, key), user.srno)
         
 
     def find_user(self, key: str, value: str) -> Optional[User]:
+        finder = self._finders.get(key)
+        if finder is None:
+            return None # Unknown field
+        return finder(value)
+
+    def _find_by_srno(self, value: str) -> Optional[User]:
         # O(1) Performance Optimization for unique ID search
-        if key == 'srno':
-            try:
-                srno_val = int(value)
-                return self.srno_index.get(srno_val)
-            except ValueError:
-                return None # Invalid srno format
-
-        # Fallback to O(n) linear search for non-indexed fields
-        for entry in self.entries:
-            # Robustness: Use getattr and case-insensitive comparison
-            entry_value = str(getattr(entry, key, '')).lower()
-            if entry_value == str(value).lower():
-                return entry
-        return None
+        try:
+            return self.srno_index.get(int(value))
+        except ValueError:
+            return None # Invalid srno format
+
+    def _find_by_age(self, value: str) -> Optional[User]:
+        # Ages are indexed as ints, so the lookup compares int to int
+        age_int = self._parse_age(value)
+        if age_int is None:
+            return None # Invalid age format
+        return self._first_match(self.indexes['age'].get(age_int))
+
+    def _find_by_text(self, index: Dict[Any, Dict[int, None]], value: str) -> Optional[User]:
+        # O(1) average, case-insensitive lookup through a secondary index
+        return self._first_match(index.get(str(value).lower()))
+
+    def _first_match(self, srnos: Optional[Dict[int, None]]) -> Optional[User]:
+        return self.srno_index[next(iter(srnos))] if srnos else None
+
+    def find_all_by_age(self, min_age: int, max_age: int) -> List[User]:
+        """Returns every user whose age lies in the inclusive range [min_age, max_age]."""
+        return [user for user in self.entries if min_age <= user.age <= max_age]
 
     def update_user(self, key: str, value: str, new_data: dict) -> bool:
         # Find user using optimized method
@@ -79,14 +194,22 @@ class UserDatabase:
         if user:
             for field, val in new_data.items():
                 if field == 'age':
-                    try:
-                        val = int(val)
-                    except ValueError:
+                    val = self._parse_age(val)
+                    if val is None:
                         print("Error: Update failed. Age must be a valid number.")
                         return False
+                elif field in self._INTERNED and isinstance(val, str):
+                    val = sys.intern(val)
                 
-                # Update the attribute on the User object
+                # Update the attribute on the User object, moving it between index buckets
+                if field in self.indexes:
+                    old_norm = self._index_key(field, getattr(user, field))
+                    # Unchanged keys stay put, keeping the user's place in the bucket
+                    if old_norm != self._index_key(field, val):
+                        self._unindex_field(field, getattr(user, field), user.srno)
+                        self._index_field(field, val, user.srno)
                 setattr(user, field, val)
+                self._render_cache.pop(user.srno, None)
                 
             # Note: srno and srno_index do not need modification 
             # because the User object reference is preserved.
@@ -98,9 +221,16 @@ class UserDatabase:
         user = self.find_user(key, value)
         
         if user:
-            # Remove from both structures for consistency (O(1) removal from index)
-            self.entries.remove(user) # O(n) removal from list, but less frequent than search
+            # O(1) removal from list: move the last entry into the freed slot
+            idx = self.pos_index.pop(user.srno)
+            last = self.entries.pop()
+            if last is not user:
+                self.entries[idx] = last
+                self.pos_index[last.srno] = idx
             del self.srno_index[user.srno] # O(1) removal from dictionary
+            for field in self.indexes:
+                self._unindex_field(field, getattr(user, field), user.srno)
+            self._render_cache.pop(user.srno, None)
             return True
         return False
 
@@ -110,19 +240,27 @@ class UserDatabase:
             print("No users found in database.")
             return
             
-        print(f"\n===== Displaying All {len(self.entries)} Users =====")
-        for user in self.entries:
-            self.display_user(user)
-        print("=" * 43)
+        # Build the whole listing first and emit it with a single write
+        out = [f"\n===== Displaying All {len(self.entries)} Users =====\n"]
+        out.extend(map(self._render_user, self.entries))
+        out.append(_SEP43 + "\n")
+        sys.stdout.write("".join(out))
 
-    @staticmethod
-    def display_user(user: User):
+    @classmethod
+    def _format_user(cls, user: User) -> str:
+        """Renders a single user's details as a block of text."""
+        return cls._ROW_FMT.format(*cls._VALUES(user))
+
+    def _render_user(self, user: User) -> str:
+        """Returns the user's rendered text, formatting it only on a cache miss."""
+        text = self._render_cache.get(user.srno)
+        if text is None:
+            text = self._render_cache[user.srno] = self._format_user(user)
+        return text
+
+    def display_user(self, user: User):
         """Displays a single user's details."""
-        print("-" * 30)
-        # asdict is used for clean, automatic display
-        for key, val in asdict(user).items():
-            print(f"{key.capitalize()}: {val}")
-        print("-" * 30)
+        sys.stdout.write(self._render_user(user))
 
 
 # -----------------------------
@@ -138,6 +276,24 @@ def get_user_input() -> Dict[str, str]:
     }
 
 
+def get_user_input_batch() -> Optional[Dict[str, str]]:
+    """Collects one user from a single comma-separated line; None at a blank line or EOF."""
+    while True:
+        try:
+            line = input("name,age,gender,occupation: ").strip()
+        except EOFError:
+            return None
+        if not line:
+            return None
+
+        # One input() and one split per user instead of four prompts
+        parts = line.split(",")
+        if len(parts) == 4:
+            name, age, gender, occupation = (part.strip() for part in parts)
+            return {"name": name, "age": age, "gender": gender, "occupation": occupation}
+        print("⚠️ Expected 4 comma-separated values. Line skipped.")
+
+
 def get_search_criteria() -> Optional[tuple[str, str]]:
     """Handles user input to select a search field and value."""
     options = ["srno", "name", "age", "gender", "occupation"]
@@ -156,6 +312,88 @@ def get_search_criteria() -> Optional[tuple[str, str]]:
     return None
 
 
+# -----------------------------
+# Menu Operations
+# -----------------------------
+# Each handler performs one menu option and returns False to end the session.
+def _op_add(db: UserDatabase) -> bool:
+    user_data = get_user_input()
+    db.add_user(**user_data)
+    print("✅ Entry successfully added.")
+    return True
+
+
+def _op_update(db: UserDatabase) -> bool:
+    search_tuple = get_search_criteria()
+    if search_tuple:
+        key, value = search_tuple
+        print('Enter the updated details:-')
+        new_data = get_user_input()
+        if db.update_user(key, value, new_data):
+            print("✅ Entry successfully updated.")
+        else:
+            print("⚠️ Update failed. Entry not found or invalid data provided.")
+    return True
+
+
+def _op_delete(db: UserDatabase) -> bool:
+    search_tuple = get_search_criteria()
+    if search_tuple:
+        key, value = search_tuple
+        if db.delete_user(key, value):
+            print("✅ Entry successfully deleted.")
+        else:
+            print("⚠️ Deletion failed. Entry not found.")
+    return True
+
+
+def _op_search(db: UserDatabase) -> bool:
+    search_tuple = get_search_criteria()
+    if search_tuple:
+        key, value = search_tuple
+        user = db.find_user(key, value)
+        if user:
+            db.display_user(user)
+        else:
+            print("⚠️ No entry found matching the criteria.")
+    return True
+
+
+def _op_display(db: UserDatabase) -> bool:
+    db.display_all()
+    return True
+
+
+def _op_exit(db: UserDatabase) -> bool:
+    print("👋 Exiting User Management System. Goodbye!")
+    return False
+
+
+def _op_bulk_add(db: UserDatabase) -> bool:
+    print("Enter one user per line (blank line to finish):")
+    rows = []
+    row = get_user_input_batch()
+    while row is not None:
+        rows.append(row)
+        row = get_user_input_batch()
+    added = db.add_users_bulk(rows)
+    if added:
+        print(f"✅ {added} {'entry' if added == 1 else 'entries'} successfully added.")
+    return True
+
+
+# Menu dispatch table: a single dict lookup instead of an if/elif chain
+_OPTIONS: Dict[int, Callable[[UserDatabase], bool]] = {
+    1: _op_add,
+    2: _op_update,
+    3: _op_delete,
+    4: _op_search,
+    5: _op_display,
+    6: _op_exit,
+    7: _op_bulk_add,
+}
+
+
 # -----------------------------
 # Main Application
 # -----------------------------
@@ -171,59 +409,26 @@ def main():
         print("4. Search an entry")
         print("5. Display all entries")
         print("6. Exit")
+        print("7. Bulk add entries")
 
         try:
             choice = int(input("Enter your choice: "))
         except ValueError:
             print("⚠️ Invalid input! Please enter a number.")
             continue
+        except EOFError:
+            # Piped input ran out (e.g. after a bulk add ended at EOF)
+            _op_exit(db)
+            break
+
+        handler = _OPTIONS.get(choice)
+        if handler is None:
+            print(f"Invalid option. Please enter a number between 1 and {len(_OPTIONS)}.")
+            continue
         
         try:
-            if choice == 1:
-                user_data = get_user_input()
-                db.add_user(**user_data)
-                print("✅ Entry successfully added.")
-                
-            elif choice == 2:
-                search_tuple = get_search_criteria()
-                if search_tuple:
-                    key, value = search_tuple
-                    print('Enter the updated details:-')
-                    new_data = get_user_input()
-                    if db.update_user(key, value, new_data):
-                        print("✅ Entry successfully updated.")
-                    else:
-                        print("⚠️ Update failed. Entry not found or invalid data provided.")
-                        
-            elif choice == 3:
-                search_tuple = get_search_criteria()
-                if search_tuple:
-                    key, value = search_tuple
-                    if db.delete_user(key, value):
-                        print("✅ Entry successfully deleted.")
-                    else:
-                        print("⚠️ Deletion failed. Entry not found.")
-                        
-            elif choice == 4:
-                search_tuple = get_search_criteria()
-                if search_tuple:
-                    key, value = search_tuple
-                    user = db.find_user(key, value)
-                    if user:
-                        db.display_user(user)
-                    else:
-                        print("⚠️ No entry found matching the criteria.")
-                        
-            elif choice == 5:
-                db.display_all()
-                
-            elif choice == 6:
-                print("👋 Exiting User Management System. Goodbye!")
+            if not handler(db):
                 break
-                
-            else:
-                print("Invalid option. Please enter a number between 1 and 6.")
-                
         except Exception as e:
             # Catching generic errors for robustness in the main loop
             print(f"An unexpected application error occurred: {e}")